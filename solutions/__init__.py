@@ -1,14 +1,128 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+import mmap as _mmap
+import threading as _threading
+from functools import cache as _memoize, wraps as _wraps
 from pathlib import Path as _Path
+from time import perf_counter_ns as _now
 
 _DATA_DIR = _Path(__file__).resolve().parent.parent / "data"
 
+# Time spent loading and parsing data, per thread, so the runner can split
+# a solve() into phases.
+_phases = _threading.local()
 
-def data(problem):
-    prefix = f"p{problem:03d}_"
+
+def _charge(phase, start):
+    ns = _phases.__dict__.setdefault("ns", {})
+    ns[phase] = ns.get(phase, 0) + _now() - start
+
+
+def _timed(phase):
+    def wrap(func):
+        @_wraps(func)
+        def inner(*args):
+            if getattr(_phases, "active", False):
+                return func(*args)
+            _phases.active = True
+            start = _now()
+            try:
+                return func(*args)
+            finally:
+                _phases.active = False
+                _charge(phase, start)
+        return inner
+    return wrap
+
+
+def _take_phases():
+    return _phases.__dict__.pop("ns", {})
+
+
+@_memoize
+@_timed("data")
+def _index():
+    index = {}
     for path in _DATA_DIR.iterdir():
-        if path.name.startswith(prefix):
-            return path.read_text()
-    raise FileNotFoundError(f"no data file for problem {problem}")
+        name = path.name
+        if name[:1] == "p" and name[1:4].isdigit() and name[4:5] == "_":
+            index[int(name[1:4])] = path
+    return index
+
+
+def data_path(problem):
+    try:
+        return _index()[problem]
+    except KeyError:
+        raise FileNotFoundError(f"no data file for problem {problem}") from None
+
+
+@_memoize
+@_timed("data")
+def data_bytes(problem):
+    return data_path(problem).read_bytes()
+
+
+@_memoize
+@_timed("data")
+def data(problem):
+    return data_bytes(problem).decode()
+
+
+@_memoize
+@_timed("data")
+def _mapped(problem):
+    with open(data_path(problem), "rb") as f:
+        try:
+            return _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return b""
+
+
+def data_buffer(problem):
+    return memoryview(_mapped(problem))
+
+
+def data_lines(problem):
+    buf = _mapped(problem)
+    pos, end = 0, len(buf)
+    while pos < end:
+        start = _now()
+        stop = buf.find(b"\n", pos)
+        if stop < 0:
+            stop = end
+        line = buf[pos:stop].strip()
+        pos = stop + 1
+        _charge("data", start)
+        if line:
+            yield line
+
+
+# Parsed forms are memoized on the raw content, so problems sharing an
+# identical input file (42 and 98) parse it once. They are returned as
+# tuples; callers that mutate must copy.
+
+@_memoize
+@_timed("parse")
+def _parse_grid(raw):
+    sep = b"," if b"," in raw else None
+    return tuple(tuple(int(x) for x in line.split(sep)) for line in raw.splitlines() if line.strip())
+
+
+@_memoize
+@_timed("parse")
+def _parse_words(raw):
+    return tuple(w.strip('"') for w in raw.decode().strip().split(","))
+
+
+def data_grid(problem):
+    return _parse_grid(data_bytes(problem))
+
+
+def data_triangle(problem):
+    return _parse_grid(data_bytes(problem))
+
+
+def data_words(problem):
+    return _parse_words(data_bytes(problem))
@@ -1,64 +1,97 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-import importlib
 import sys
-import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-_PARENT = Path(__file__).resolve().parent
-_ROOT = _PARENT.parent
+_ROOT = Path(__file__).resolve().parent.parent
 
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
-
-def _discover():
-    return sorted(
-        int(p.stem.split("_")[1])
-        for p in _PARENT.glob("problem_*.py")
-    )
-
-
-def _solve_one(n):
-    module = importlib.import_module(f".problem_{n}", package="solutions")
-    start = time.perf_counter()
-    result = module.solve()
-    elapsed = (time.perf_counter() - start) * 1000
-    return n, result, elapsed
-
-
-def run(numbers=None):
-    if numbers is None:
-        numbers = _discover()
-
-    pending = {}
-    results = {}
-    cpu_total = 0
-    wall_start = time.perf_counter()
-
-    with ThreadPoolExecutor() as pool:
-        for n in numbers:
-            pending[n] = pool.submit(_solve_one, n)
-
-        print_idx = 0
-        for future in as_completed(pending.values()):
-            n, result, elapsed = future.result()
-            results[n] = (result, elapsed)
-            cpu_total += elapsed
-
-            while print_idx < len(numbers) and numbers[print_idx] in results:
-                pn = numbers[print_idx]
-                r, e = results.pop(pn)
-                print(f"Problem {pn:>3}: {str(r):<30s} ({e:.2f}ms)")
-                print_idx += 1
-
-    wall = (time.perf_counter() - wall_start) * 1000
-    if len(numbers) > 1:
-        print(f"\nSolved {len(numbers)} problems in {wall:.2f}ms (cpu: {cpu_total:.2f}ms)")
+from solutions._runner import _EXECUTORS, _SCHEDULES, run
+
+
+def _parse_args(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m solutions")
+    parser.add_argument("problems", nargs="*", type=int)
+    parser.add_argument("--executor", choices=_EXECUTORS,
+                        help="pool type (default: process for several problems, else thread)")
+    parser.add_argument("-j", "--jobs", type=int, help="worker count (default: CPU count)")
+    parser.add_argument("--schedule", choices=_SCHEDULES, default="lpt",
+                        help="submission order: numeric, or longest recorded time first")
+    parser.add_argument("--no-cache", dest="cache", action="store_false",
+                        help="neither read nor write the result cache")
+    parser.add_argument("--refresh", action="store_true",
+                        help="recompute every answer and overwrite its cache entry")
+    parser.add_argument("--profile", nargs="?", type=int, const=10, metavar="TOP",
+                        help="run solve() under cProfile and print the TOP (default: 10) "
+                             "functions by cumulative time")
+    parser.add_argument("--profile-dir", type=Path,
+                        help="also write problem_N.prof and collapsed stacks here")
+    parser.add_argument("--memory", action="store_true",
+                        help="report tracemalloc peak and RSS high-water mark, one process per problem")
+    parser.add_argument("--phases", action="store_true",
+                        help="break each time down into import, data, parse and compute")
+    parser.add_argument("--format", choices=("text", "ndjson"), default="text",
+                        help="output format; ndjson prints one JSON object per problem")
+    parser.add_argument("--unordered", action="store_true",
+                        help="print each problem as soon as it finishes")
+    parser.add_argument("--workers", type=_addresses, metavar="HOST:PORT,...",
+                        help="solve on remote workers instead of a local pool")
+    parser.add_argument("--no-daemon", dest="daemon", action="store_false",
+                        help="solve locally even if `serve` is running")
+    return parser.parse_args(argv)
+
+
+def _addresses(text):
+    from solutions._cluster import parse_address
+    return [parse_address(a) for a in text.split(",") if a]
+
+
+def _serve(argv, command):
+    import argparse
+
+    from solutions._cluster import parse_address, serve
+    from solutions._runner import DAEMON_SOCKET
+
+    parser = argparse.ArgumentParser(prog=f"python -m solutions {command}")
+    if command == "worker":
+        parser.add_argument("--listen", type=parse_address, default=("127.0.0.1", 7878),
+                            metavar="HOST:PORT", help="address to accept coordinators on")
+    else:
+        parser.add_argument("--socket", dest="listen", default=str(DAEMON_SOCKET),
+                            help=f"Unix socket to listen on (default: {DAEMON_SOCKET})")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    if command == "serve":
+        DAEMON_SOCKET.parent.mkdir(exist_ok=True)
+    try:
+        serve(args.listen, args.jobs)
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
-    args = sys.argv[1:]
-    run([int(a) for a in args] if args else None)
+    if sys.argv[1:2] == ["bench"]:
+        from solutions import _bench
+        sys.exit(_bench.main(sys.argv[2:]))
+    if sys.argv[1:2] in (["worker"], ["serve"]):
+        sys.exit(_serve(sys.argv[2:], sys.argv[1]))
+    if sys.argv[1:2] == ["manifest"]:
+        from solutions import _manifest
+        print(f"Indexed {len(_manifest.build()['problems'])} problems")
+        sys.exit()
+    if all(a.isdigit() for a in sys.argv[1:]):
+        # Bare problem numbers: setting up argparse costs more than most solves.
+        sys.exit(run([int(a) for a in sys.argv[1:]] or None))
+    args = _parse_args(sys.argv[1:])
+    profile = None
+    if args.profile is not None or args.profile_dir is not None:
+        profile = (args.profile or 10, args.profile_dir)
+    run(args.problems or None, executor=args.executor, jobs=args.jobs,
+        schedule=args.schedule, cache=args.cache, refresh=args.refresh, profile=profile,
+        memory=args.memory, phases=args.phases, format=args.format, unordered=args.unordered,
+        workers=args.workers, daemon=args.daemon)
@@ -0,0 +1,131 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+import argparse
+import importlib
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from ._memory import format_bytes, measured
+
+_ROOT = Path(__file__).resolve().parent.parent
+_REPORT = _ROOT / ".cache" / "bench.json"
+_BASELINE = _ROOT / ".cache" / "bench-baseline.json"
+_CHILD = "from solutions._bench import _child; _child({}, {})"
+
+
+def _child(n, memory):
+    module = importlib.import_module(f".problem_{n}", package="solutions")
+    if memory:
+        _, sample = measured(module.solve)
+    else:
+        start = time.perf_counter_ns()
+        module.solve()
+        sample = {"ns": time.perf_counter_ns() - start}
+    print(json.dumps(sample))
+
+
+def _sample(n, memory=False):
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(n, memory)],
+        cwd=_ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def _percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _summarise(samples):
+    return {
+        "samples_ns": samples,
+        "min_ns": min(samples),
+        "median_ns": int(statistics.median(samples)),
+        "p95_ns": _percentile(samples, 0.95),
+        "stdev_ns": int(statistics.stdev(samples)) if len(samples) > 1 else 0,
+    }
+
+
+def bench(numbers, warmup=1, repeat=5, memory=False):
+    report = {
+        "python": platform.python_version(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "problems": {},
+    }
+    for n in numbers:
+        for _ in range(warmup):
+            _sample(n)
+        stats = _summarise([_sample(n)["ns"] for _ in range(repeat)])
+        line = (
+            f"Problem {n:>3}: min {stats['min_ns'] / 1e6:10.2f}ms"
+            f"  median {stats['median_ns'] / 1e6:10.2f}ms"
+            f"  p95 {stats['p95_ns'] / 1e6:10.2f}ms"
+            f"  stdev {stats['stdev_ns'] / 1e6:8.2f}ms"
+        )
+        if memory:
+            # Measured in a separate run so tracing does not skew the timings.
+            mem = _sample(n, memory=True)
+            stats["tracemalloc_peak_bytes"] = mem["peak"]
+            stats["max_rss_bytes"] = mem["rss"]
+            line += f"  peak {format_bytes(mem['peak'])}  rss {format_bytes(mem['rss'])}"
+        report["problems"][str(n)] = stats
+        print(line, flush=True)
+    return report
+
+
+def compare(report, baseline, threshold):
+    regressions = []
+    for key, stats in report["problems"].items():
+        old = baseline["problems"].get(key)
+        if old is None or not old["median_ns"]:
+            continue
+        change = stats["median_ns"] / old["median_ns"] - 1
+        if change > threshold:
+            regressions.append(int(key))
+        print(f"Problem {key:>3}: {change:+8.1%} vs baseline{'  REGRESSION' if change > threshold else ''}")
+    return regressions
+
+
+def main(argv):
+    from ._runner import discover
+
+    parser = argparse.ArgumentParser(prog="python -m solutions bench")
+    parser.add_argument("problems", nargs="*", type=int)
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per problem")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="timed runs per problem")
+    parser.add_argument("-o", "--output", type=Path, default=_REPORT, help="JSON report path")
+    parser.add_argument("--baseline", type=Path, default=_BASELINE, help="report to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this report as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed fractional slowdown of the median (default: 0.10)")
+    parser.add_argument("--memory", action="store_true",
+                        help="also record tracemalloc peak and RSS high-water mark")
+    args = parser.parse_args(argv)
+
+    report = bench(args.problems or discover(), args.warmup, args.repeat, args.memory)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=1))
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=1))
+        return 0
+    if not args.baseline.exists():
+        return 0
+    print()
+    regressions = compare(report, json.loads(args.baseline.read_text()), args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} problem(s) regressed by more than {args.threshold:.0%}: "
+              f"{' '.join(map(str, regressions))}")
+        return 1
+    return 0
@@ -0,0 +1,54 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+import json
+import os
+import time
+from pathlib import Path
+
+from . import _manifest
+
+_RESULTS_DIR = Path(__file__).resolve().parent.parent / ".cache" / "results"
+_VERSION = 1
+_MAX_BYTES = 1 << 20
+_MAX_AGE = 30 * 24 * 3600
+
+
+def key(n):
+    # The manifest hash covers the problem module, every package module it
+    # imports and its data file.
+    return f"{n}-{_manifest.entry(n)['sha256'][:32]}-v{_VERSION}"
+
+
+def get(n):
+    path = _RESULTS_DIR / f"{key(n)}.json"
+    try:
+        entry = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    os.utime(path)
+    return entry["answer"]
+
+
+def put(n, answer):
+    if not isinstance(answer, (int, str)):
+        return
+    _RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = _RESULTS_DIR / f"{key(n)}.json"
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"problem": n, "answer": answer}))
+    tmp.replace(path)
+
+
+def evict(max_bytes=_MAX_BYTES, max_age=_MAX_AGE):
+    try:
+        entries = [(p.stat(), p) for p in _RESULTS_DIR.glob("*.json")]
+    except OSError:
+        return
+    entries.sort(key=lambda e: e[0].st_mtime, reverse=True)
+    cutoff = time.time() - max_age
+    total = 0
+    for st, path in entries:
+        total += st.st_size
+        if st.st_mtime < cutoff or total > max_bytes:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,355 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+# Run problems on other machines.
+#
+# A worker (`python -m solutions worker --listen HOST:PORT`) solves problems
+# in a local process pool. The coordinator side is `RemoteExecutor`, which
+# `run()` uses in place of a local pool when given `--workers`. Both ends
+# speak newline-delimited JSON over TCP:
+#
+#     worker -> coordinator   {"op": "hello", "slots": 8}
+#     coordinator -> worker   {"op": "solve", "problem": 14, "profile": null, "memory": false,
+#                              "reuse": true}
+#
+# "profile" is [top, dump]; with dump, the worker returns the .prof data
+# (base64) and collapsed stacks in extra["profile_files"] and the
+# coordinator writes them. Memory runs get a fresh process each. There is
+# no authentication, so workers should only listen on trusted networks.
+#     worker -> coordinator   {"op": "result", "problem": 14, "result": ..., "elapsed": ..., "extra": {...}}
+#                             {"op": "error", "problem": 14, "error": "..."}
+#                             {"op": "heartbeat"}
+#
+# `python -m solutions serve` runs the same server on a Unix domain socket as
+# a resident daemon; the runner forwards to it whenever it is up. Pool
+# processes import every problem up front and keep their module state, and
+# answers are remembered per source hash, so repeated requests are instant.
+# A problem whose source hash no longer matches the one the pool imported is
+# solved in a fresh process instead, so edits take effect without a restart.
+#
+# Workers pull as many problems as they have slots. Once the queue is empty, an
+# idle worker steals a copy of a problem still running elsewhere and the first
+# answer wins. A worker that disconnects or misses heartbeats is dropped and its
+# problems go back on the queue.
+
+import base64
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+HEARTBEAT = 1.0
+TIMEOUT = 5.0
+
+
+def parse_address(text):
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _label(address):
+    return address if isinstance(address, str) else f"{address[0]}:{address[1]}"
+
+
+def _connect(address):
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX)
+        sock.settimeout(TIMEOUT)
+        try:
+            sock.connect(address)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+    sock = socket.create_connection(address, timeout=TIMEOUT)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def _listen(address):
+    if isinstance(address, str):
+        try:
+            os.unlink(address)
+        except FileNotFoundError:
+            pass
+        server = socket.socket(socket.AF_UNIX)
+        server.bind(address)
+        server.listen()
+        return server
+    return socket.create_server(address)
+
+
+def _warm():
+    from . import _manifest
+
+    for n in _manifest.problems():
+        importlib.import_module(f".problem_{n}", package="solutions")
+
+
+def _send(sock, lock, message):
+    data = (json.dumps(message, default=str) + "\n").encode()
+    with lock:
+        sock.sendall(data)
+
+
+def _serve_connection(conn, pool, isolated, imported, slots, answers):
+    from . import _manifest
+    from ._runner import solve_one
+
+    lock = threading.Lock()
+    closed = threading.Event()
+
+    def heartbeat():
+        while not closed.wait(HEARTBEAT):
+            try:
+                _send(conn, lock, {"op": "heartbeat"})
+            except OSError:
+                return
+
+    def finished(future, n, key):
+        try:
+            _, result, elapsed, extra = future.result()
+            if "profile_files" in extra:
+                files = extra["profile_files"]
+                files["prof"] = base64.b64encode(files["prof"]).decode()
+            message = {"op": "result", "problem": n, "result": result,
+                       "elapsed": elapsed, "extra": extra}
+            if key is not None:
+                answers[key] = result
+        except Exception as exc:
+            message = {"op": "error", "problem": n, "error": f"{type(exc).__name__}: {exc}"}
+        try:
+            _send(conn, lock, message)
+        except OSError:
+            pass
+
+    threading.Thread(target=heartbeat, daemon=True).start()
+    try:
+        _send(conn, lock, {"op": "hello", "slots": slots})
+        for line in conn.makefile("rb"):
+            message = json.loads(line)
+            if message["op"] == "solve":
+                n = message["problem"]
+                profile, memory = message.get("profile"), bool(message.get("memory"))
+                if profile is not None:
+                    # Nothing from the peer becomes a path: files come back in the reply.
+                    profile = (int(profile[0]), bool(profile[1]))
+                try:
+                    sha256 = _manifest.entry(n)["sha256"]
+                except KeyError as exc:
+                    _send(conn, lock, {"op": "error", "problem": n, "error": f"KeyError: {exc}"})
+                    continue
+                key = None
+                if profile is None and not memory:
+                    key = (n, sha256)
+                    if message.get("reuse", True) and key in answers:
+                        _send(conn, lock, {"op": "result", "problem": n, "result": answers[key],
+                                           "elapsed": None, "extra": {}})
+                        continue
+                # The warm pool still runs the code it imported at start-up, and
+                # its long-lived processes would mix memory high-water marks.
+                target = pool if imported.get(n) == sha256 and not memory else isolated
+                future = target.submit(solve_one, n, profile, memory)
+                future.add_done_callback(lambda f, n=n, key=key: finished(f, n, key))
+            elif message["op"] == "bye":
+                break
+    except (OSError, ValueError):
+        pass
+    finally:
+        closed.set()
+        conn.close()
+
+
+def serve(address, jobs=None):
+    from . import _manifest
+    from ._runner import _pool_type
+
+    slots = jobs or os.cpu_count() or 1
+    answers = {}
+    # Hashed before the pool imports anything, so an edit racing start-up
+    # can only cause a needless fresh process, never a stale answer.
+    imported = {n: _manifest.entry(n)["sha256"] for n in _manifest.problems()}
+    # Spawned rather than forked, so pool processes do not inherit the
+    # listening socket and keep accepting after the worker has died.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=slots, mp_context=context, initializer=_warm) as pool, \
+            _pool_type("process", True)(max_workers=slots, mp_context=context) as isolated, \
+            _listen(address) as server:
+        for future in [pool.submit(time.sleep, 0) for _ in range(slots)]:
+            future.result()
+        if not isinstance(address, str):
+            address = server.getsockname()[:2]
+        print(f"Listening on {_label(address)} with {slots} slots", flush=True)
+        try:
+            while True:
+                conn, _ = server.accept()
+                threading.Thread(target=_serve_connection,
+                                 args=(conn, pool, isolated, imported, slots, answers),
+                                 daemon=True).start()
+        finally:
+            if isinstance(address, str):
+                os.unlink(address)
+
+
+class _Worker:
+    def __init__(self, address):
+        self.address = address
+        self.sock = _connect(address)
+        self.lock = threading.Lock()
+        self.reader = self.sock.makefile("rb")
+        hello = json.loads(self.reader.readline())
+        self.sock.settimeout(None)
+        self.slots = hello["slots"]
+        self.running = {}
+        self.seen = time.monotonic()
+        self.alive = True
+
+    def send(self, message):
+        _send(self.sock, self.lock, message)
+
+
+class RemoteExecutor(Executor):
+    # Only ever runs solve_one; fn is accepted for Executor compatibility.
+
+    def __init__(self, addresses, max_workers=None, quiet=False, reuse=True):
+        self._reuse = reuse
+        self._cond = threading.Condition()
+        self._queue = deque()
+        self._tasks = {}
+        self._workers = []
+        for address in addresses:
+            try:
+                self._workers.append(_Worker(address))
+            except (OSError, ValueError) as exc:
+                if not quiet:
+                    print(f"Skipping worker {_label(address)}: {exc}", file=sys.stderr)
+        if not self._workers:
+            raise ConnectionError("no remote workers reachable")
+        self._closing = False
+        for worker in self._workers:
+            threading.Thread(target=self._read, args=(worker,), daemon=True).start()
+        threading.Thread(target=self._monitor, daemon=True).start()
+
+    def submit(self, fn, n, profile=None, memory=False):
+        future = Future()
+        with self._cond:
+            self._tasks[n] = (future, profile, memory)
+            self._queue.append(n)
+            self._dispatch()
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._cond:
+            if wait:
+                self._cond.wait_for(lambda: all(f.done() for f, _, _ in self._tasks.values()))
+            self._closing = True
+            for worker in self._workers:
+                if worker.alive:
+                    try:
+                        worker.send({"op": "bye"})
+                    except OSError:
+                        pass
+                    worker.sock.close()
+
+    def _send_task(self, worker, n):
+        _, profile, memory = self._tasks[n]
+        try:
+            worker.send({"op": "solve", "problem": n, "profile": profile, "memory": memory,
+                         "reuse": self._reuse})
+        except OSError:
+            self._drop(worker)
+            return False
+        worker.running[n] = time.monotonic()
+        return True
+
+    def _dispatch(self):
+        # Called with the condition held.
+        live = [w for w in self._workers if w.alive]
+        for worker in live:
+            while self._queue and len(worker.running) < worker.slots:
+                n = self._queue.popleft()
+                if not self._tasks[n][0].done() and not self._send_task(worker, n):
+                    self._queue.appendleft(n)
+                    break
+        if self._queue:
+            return
+        # Steal: give idle capacity a copy of the longest-running unfinished work.
+        for worker in live:
+            if not worker.alive or len(worker.running) >= worker.slots:
+                continue
+            candidates = [(started, n) for other in live if other is not worker
+                          for n, started in other.running.items()
+                          if n not in worker.running and not self._tasks[n][0].done()]
+            if candidates:
+                self._send_task(worker, min(candidates)[1])
+
+    def _drop(self, worker):
+        # Called with the condition held.
+        if not worker.alive:
+            return
+        worker.alive = False
+        worker.sock.close()
+        live = [w for w in self._workers if w.alive]
+        for n in worker.running:
+            future = self._tasks[n][0]
+            if not future.done() and not any(n in w.running for w in live):
+                self._queue.appendleft(n)
+        worker.running.clear()
+        if not live:
+            for future, _, _ in self._tasks.values():
+                if not future.done():
+                    future.set_exception(RuntimeError("all remote workers were lost"))
+        else:
+            self._dispatch()
+        self._cond.notify_all()
+
+    def _read(self, worker):
+        try:
+            for line in worker.reader:
+                message = json.loads(line)
+                with self._cond:
+                    worker.seen = time.monotonic()
+                    if message["op"] in ("result", "error"):
+                        self._finish(worker, message)
+        except (OSError, ValueError):
+            pass
+        with self._cond:
+            if not self._closing:
+                self._drop(worker)
+
+    def _finish(self, worker, message):
+        n = message["problem"]
+        worker.running.pop(n, None)
+        future = self._tasks[n][0]
+        if not future.done():
+            if message["op"] == "result":
+                extra = message["extra"]
+                if "profile_files" in extra:
+                    files = extra["profile_files"]
+                    files["prof"] = base64.b64decode(files["prof"])
+                if "worker" in extra:
+                    extra["worker"] = f"{_label(worker.address)}/{extra['worker']}"
+                future.set_result((n, message["result"], message["elapsed"], extra))
+            else:
+                future.set_exception(RuntimeError(f"problem {n} failed on "
+                                                  f"{_label(worker.address)}: "
+                                                  f"{message['error']}"))
+        self._dispatch()
+        self._cond.notify_all()
+
+    def _monitor(self):
+        while True:
+            time.sleep(HEARTBEAT)
+            with self._cond:
+                if self._closing:
+                    return
+                now = time.monotonic()
+                for worker in self._workers:
+                    if worker.alive and now - worker.seen > TIMEOUT:
+                        self._drop(worker)
@@ -0,0 +1,142 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+import json
+import os
+from pathlib import Path
+
+from . import _DATA_DIR, _index
+
+_PACKAGE = Path(__file__).resolve().parent
+_ROOT = _PACKAGE.parent
+_MANIFEST = _ROOT / ".cache" / "manifest.json"
+_VERSION = 2
+
+_loaded = None
+
+
+def _local_imports(path):
+    import ast
+
+    for node in ast.walk(ast.parse(path.read_bytes())):
+        if isinstance(node, ast.ImportFrom) and node.level == 1:
+            if node.module:
+                yield _PACKAGE / f"{node.module}.py"
+            else:
+                for alias in node.names:
+                    sub = _PACKAGE / f"{alias.name}.py"
+                    yield sub if sub.exists() else _PACKAGE / "__init__.py"
+
+
+def _sources(path):
+    # The module plus everything it pulls in from this package, followed
+    # transitively.
+    seen = set()
+    stack = [path]
+    while stack:
+        path = stack.pop()
+        if path in seen or not path.exists():
+            continue
+        seen.add(path)
+        stack.extend(_local_imports(path))
+    return sorted(seen)
+
+
+def _requires(path):
+    import ast
+
+    for node in ast.parse(path.read_bytes()).body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == "REQUIRES" for t in node.targets):
+            return ast.literal_eval(node.value)
+    return {}
+
+
+def _stamp(path):
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _digest(files):
+    import hashlib
+
+    h = hashlib.sha256()
+    for path in files:
+        h.update(path.name.encode())
+        h.update(hashlib.sha256(path.read_bytes()).digest())
+    return h.hexdigest()
+
+
+def source_hash(module):
+    # The same hash as a problem's, for any package module: its source and
+    # everything it imports from the package.
+    return _digest(_sources(_PACKAGE / f"{module}.py"))
+
+
+def _entry(n):
+    data = _index().get(n)
+    module = _PACKAGE / f"problem_{n}.py"
+    files = _sources(module) + ([data] if data else [])
+    return {
+        "module": f"problem_{n}",
+        "data": data.name if data else None,
+        "sha256": _digest(files),
+        "requires": _requires(module),
+        "files": {str(path.relative_to(_ROOT)): _stamp(path) for path in files},
+    }
+
+
+def _fresh(entry):
+    try:
+        return all(_stamp(_ROOT / f) == s for f, s in entry["files"].items())
+    except OSError:
+        return False
+
+
+def _save(manifest):
+    _MANIFEST.parent.mkdir(exist_ok=True)
+    tmp = _MANIFEST.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=1))
+    tmp.replace(_MANIFEST)
+
+
+def build():
+    global _loaded
+    problems = sorted(int(p.stem.split("_")[1]) for p in _PACKAGE.glob("problem_*.py"))
+    _loaded = {
+        "version": _VERSION,
+        "stamp": [_PACKAGE.stat().st_mtime_ns, _DATA_DIR.stat().st_mtime_ns],
+        "problems": {str(n): _entry(n) for n in problems},
+    }
+    _save(_loaded)
+    return _loaded
+
+
+def load():
+    global _loaded
+    if _loaded is None:
+        try:
+            manifest = json.loads(_MANIFEST.read_text())
+        except (OSError, ValueError):
+            manifest = None
+        # Adding or removing a problem or data file touches its directory.
+        stamp = [_PACKAGE.stat().st_mtime_ns, _DATA_DIR.stat().st_mtime_ns]
+        if not manifest or manifest.get("version") != _VERSION or manifest["stamp"] != stamp:
+            return build()
+        _loaded = manifest
+    return _loaded
+
+
+def problems():
+    return sorted(map(int, load()["problems"]))
+
+
+def entry(n):
+    manifest = load()
+    entry = manifest["problems"].get(str(n))
+    if entry is None:
+        raise KeyError(f"no problem {n}")
+    if not _fresh(entry):
+        entry = manifest["problems"][str(n)] = _entry(n)
+        _save(manifest)
+    return entry
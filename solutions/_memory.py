@@ -0,0 +1,77 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+import threading
+import tracemalloc
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def max_rss():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def measured(func):
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, {"peak": peak, "rss": max_rss()}
+
+
+def format_bytes(n):
+    if n is None:
+        return "n/a"
+    if n < 1024:
+        return f"{n}B"
+    for unit in ("KiB", "MiB"):
+        n /= 1024
+        if n < 1024:
+            return f"{n:.1f}{unit}"
+    return f"{n / 1024:.1f}GiB"
+
+
+class OneShotExecutor(Executor):
+    # max_tasks_per_child=1 for Pythons before 3.11: every task gets a
+    # single-worker process pool of its own, at most max_workers at a time.
+
+    def __init__(self, max_workers=None, **kwargs):
+        self._slots = threading.BoundedSemaphore(max_workers or os.cpu_count() or 1)
+        self._kwargs = kwargs
+        self._threads = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        thread = threading.Thread(target=self._run, args=(future, fn, args, kwargs), daemon=True)
+        self._threads.append(thread)
+        thread.start()
+        return future
+
+    def _run(self, future, fn, args, kwargs):
+        with self._slots:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                with ProcessPoolExecutor(max_workers=1, **self._kwargs) as pool:
+                    result = pool.submit(fn, *args, **kwargs).result()
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        if wait:
+            for thread in self._threads:
+                thread.join()
@@ -0,0 +1,70 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+import cProfile
+import io
+import marshal
+import pstats
+import threading
+from pathlib import Path
+
+# Only one profiler may be active per interpreter on newer CPythons, so
+# profiled calls from a thread pool take turns.
+_LOCK = threading.Lock()
+
+
+def _label(func):
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{Path(filename).stem}:{name}:{line}"
+
+
+def collapsed(stats):
+    # cProfile only records caller/callee pairs, so each edge's time is
+    # attributed to full stacks in proportion to how often that caller made
+    # the call.
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge))
+
+    lines = {}
+
+    def walk(func, stack, tt, ct):
+        stack = stack + (_label(func),)
+        if tt > 0:
+            key = ";".join(stack)
+            lines[key] = lines.get(key, 0) + tt
+        total_ct = stats.stats[func][3]
+        scale = ct / total_ct if total_ct else 0
+        for callee, (_, _, e_tt, e_ct) in callees.get(func, ()):
+            if _label(callee) not in stack:
+                walk(callee, stack, e_tt * scale, e_ct * scale)
+
+    for func, (_, _, tt, ct, callers) in stats.stats.items():
+        if not callers:
+            walk(func, (), tt, ct)
+    return "".join(f"{k} {round(v * 1e6)}\n" for k, v in sorted(lines.items()) if round(v * 1e6))
+
+
+def profiled(func, top, dump=False):
+    # With dump, the .prof contents and collapsed stacks are returned rather
+    # than written, so a remote worker never touches the caller's paths.
+    profiler = cProfile.Profile()
+    with _LOCK:
+        result = profiler.runcall(func)
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.sort_stats("cumulative").print_stats(top)
+    files = None
+    if dump:
+        files = {"prof": marshal.dumps(stats.stats), "collapsed": collapsed(stats)}
+    return result, out.getvalue(), files
+
+
+def save(n, directory, files):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"problem_{n}.prof").write_bytes(files["prof"])
+    (directory / f"problem_{n}.collapsed").write_text(files["collapsed"])
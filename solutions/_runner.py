@@ -0,0 +1,243 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+import functools
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from . import _cache, _manifest, _take_phases
+
+_PARENT = Path(__file__).resolve().parent
+_ROOT = _PARENT.parent
+
+_CACHE_DIR = _ROOT / ".cache"
+_TIMINGS = _CACHE_DIR / "timings.json"
+DAEMON_SOCKET = _CACHE_DIR / "daemon.sock"
+_EXECUTORS = ("process", "thread")
+_SCHEDULES = ("numeric", "lpt")
+_DEFAULT_ESTIMATE = 1000.0
+
+
+def discover():
+    return _manifest.problems()
+
+
+def _open_pool(executor, memory, jobs, workers=None, daemon=False, reuse=True, tables=None):
+    if workers is None and daemon and DAEMON_SOCKET.exists():
+        from ._cluster import RemoteExecutor
+        try:
+            return RemoteExecutor([str(DAEMON_SOCKET)], quiet=True, reuse=reuse)
+        except ConnectionError:
+            pass  # stale socket; solve locally
+    if workers:
+        from ._cluster import RemoteExecutor
+        return RemoteExecutor(workers, reuse=reuse)
+    if tables and executor == "process" and _start_method() != "fork":
+        from . import tables as _tables
+        return _pool_type(executor, memory)(max_workers=jobs, initializer=_tables.attach,
+                                            initargs=(_tables.publish(tables),))
+    if tables:
+        # Threads share this process's tables and forked workers inherit them.
+        from .tables import table
+        for name, size in tables.items():
+            table(name, size)
+    return _pool_type(executor, memory)(max_workers=jobs)
+
+
+def _start_method():
+    import multiprocessing
+
+    return multiprocessing.get_start_method()
+
+
+def _pool_type(executor, memory):
+    # Imported on demand: the process pool pulls in multiprocessing.
+    if executor == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+        return ThreadPoolExecutor
+    from concurrent.futures import ProcessPoolExecutor
+    if not memory:
+        return ProcessPoolExecutor
+    # A fresh process per problem keeps peaks and high-water marks apart.
+    if sys.version_info >= (3, 11):
+        return functools.partial(ProcessPoolExecutor, max_tasks_per_child=1)
+    from ._memory import OneShotExecutor
+    return OneShotExecutor
+
+
+def solve_one(n, profile=None, memory=False):
+    start = time.perf_counter_ns()
+    module = importlib.import_module(f".problem_{n}", package="solutions")
+    imported = time.perf_counter_ns()
+    _take_phases()
+    extra = {"worker": f"{os.getpid()}/{threading.current_thread().name}"}
+    cpu_start = time.thread_time_ns()
+    if profile is not None:
+        from ._profile import profiled
+        result, extra["profile"], files = profiled(module.solve, *profile)
+        if files is not None:
+            extra["profile_files"] = files
+    elif memory:
+        from ._memory import measured
+        result, extra["memory"] = measured(module.solve)
+    else:
+        result = module.solve()
+    extra["cpu_ns"] = time.thread_time_ns() - cpu_start
+    extra["elapsed_ns"] = time.perf_counter_ns() - imported
+    elapsed = extra["elapsed_ns"] / 1e6
+    phases = {k: v / 1e6 for k, v in _take_phases().items()}
+    phases["compute"] = elapsed - sum(phases.values())
+    extra["phases"] = {"import": (imported - start) / 1e6, **phases}
+    return n, result, elapsed, extra
+
+
+def _load_timings():
+    try:
+        return {int(k): v for k, v in json.loads(_TIMINGS.read_text()).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_timings(timings):
+    history = _load_timings()
+    history.update((n, round(e, 3)) for n, e in timings.items())
+    _CACHE_DIR.mkdir(exist_ok=True)
+    tmp = _TIMINGS.with_suffix(".tmp")
+    tmp.write_text(json.dumps({str(k): v for k, v in sorted(history.items())}, indent=1))
+    tmp.replace(_TIMINGS)
+
+
+def _table_sizes(numbers):
+    from .tables import merge
+
+    return merge(_manifest.entry(n).get("requires", {}) for n in numbers)
+
+
+def _lpt_order(numbers, timings):
+    import statistics
+
+    # Unknown problems are assumed to be as slow as the typical recorded one.
+    fallback = statistics.median(timings.values()) if timings else _DEFAULT_ESTIMATE
+    return sorted(numbers, key=lambda n: -timings.get(n, fallback))
+
+
+def _report(n, result, elapsed, extra, phases=False):
+    timing = "cached" if elapsed is None else f"{elapsed:.2f}ms"
+    if phases and "phases" in extra:
+        timing += "; " + ", ".join(f"{k} {v:.2f}ms" for k, v in extra["phases"].items())
+    if "memory" in extra:
+        from ._memory import format_bytes
+        mem = extra["memory"]
+        timing += f", peak {format_bytes(mem['peak'])}, rss {format_bytes(mem['rss'])}"
+    print(f"Problem {n:>3}: {str(result):<30s} ({timing})", flush=True)
+    if "profile" in extra:
+        print(extra["profile"].rstrip() + "\n", flush=True)
+
+
+def _report_ndjson(n, result, elapsed, extra, phases=False):
+    record = {
+        "problem": n,
+        "answer": result,
+        "elapsed_ns": extra.get("elapsed_ns"),
+        "cpu_ns": extra.get("cpu_ns"),
+        "worker": extra.get("worker"),
+        "cached": elapsed is None,
+    }
+    if "phases" in extra:
+        record["phases_ns"] = {k: round(v * 1e6) for k, v in extra["phases"].items()}
+    for key in ("memory", "profile"):
+        if key in extra:
+            record[key] = extra[key]
+    print(json.dumps(record, default=str), flush=True)
+
+
+def run(numbers=None, executor=None, jobs=None, schedule="lpt", cache=True, refresh=False,
+        profile=None, memory=False, phases=False, format="text", unordered=False, workers=None,
+        daemon=True):
+    if numbers is None:
+        numbers = discover()
+    # Results are keyed by problem, so each is solved and printed once.
+    numbers = list(dict.fromkeys(numbers))
+    # An explicit executor means "solve here", not on a running daemon. So do
+    # measured runs: the daemon's long-lived pool would mix their high-water
+    # marks, and profile files belong in this process's working directory.
+    daemon = daemon and executor is None and not memory and profile is None
+    if executor is None or memory:
+        # tracemalloc is process-wide, so memory runs always get their own processes.
+        executor = "process" if memory or len(numbers) > 1 else "thread"
+    if schedule == "lpt" and len(numbers) > 1:
+        order = _lpt_order(numbers, _load_timings())
+    else:
+        order = numbers
+
+    report = _report_ndjson if format == "ndjson" else _report
+    pending = {}
+    results = {}
+    if cache and not refresh and profile is None and not memory:
+        for n in numbers:
+            answer = _cache.get(n)
+            if answer is not None:
+                results[n] = (answer, None, {})
+                if unordered:
+                    report(n, *results[n], phases)
+    timings = {}
+    cpu_total = 0
+    wall_start = time.perf_counter()
+    todo = [n for n in order if n not in results]
+    # Prebuilding only pays off when several local problems share a table,
+    # and memory runs must allocate or map their own tables to be measured.
+    tables = _table_sizes(todo) if len(todo) > 1 and not workers and not memory else None
+
+    print_idx = 0
+    if todo:
+        # Imported here rather than at the top: a cached answer needs no pool.
+        from concurrent.futures import as_completed
+
+        reuse = cache and not refresh
+        with _open_pool(executor, memory, jobs, workers, daemon, reuse, tables) as pool:
+            # Workers get only the report size and whether to return the files;
+            # the files are written here.
+            request = None if profile is None else (profile[0], profile[1] is not None)
+            for n in todo:
+                pending[n] = pool.submit(solve_one, n, request, memory)
+
+            for future in as_completed(pending.values()):
+                n, result, elapsed, extra = future.result()
+                if "profile_files" in extra:
+                    from ._profile import save
+                    save(n, profile[1], extra.pop("profile_files"))
+                if elapsed is not None:
+                    timings[n] = elapsed
+                    cpu_total += elapsed
+                if cache:
+                    _cache.put(n, result)
+                if unordered:
+                    report(n, result, elapsed, extra, phases)
+                    continue
+                results[n] = (result, elapsed, extra)
+
+                while print_idx < len(numbers) and numbers[print_idx] in results:
+                    report(numbers[print_idx], *results.pop(numbers[print_idx]), phases)
+                    print_idx += 1
+
+    while not unordered and print_idx < len(numbers):
+        report(numbers[print_idx], *results.pop(numbers[print_idx]), phases)
+        print_idx += 1
+
+    wall = (time.perf_counter() - wall_start) * 1000
+    if tables and executor == "process":
+        from .tables import release
+        release()
+    # tracemalloc and cProfile inflate times many times over; keep them out
+    # of the LPT history.
+    if timings and not memory and profile is None:
+        _save_timings(timings)
+    if cache and pending:
+        _cache.evict()
+    if len(numbers) > 1 and format == "text":
+        print(f"\nSolved {len(numbers)} problems in {wall:.2f}ms (cpu: {cpu_total:.2f}ms)")
@@ -0,0 +1,115 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+# Built tables kept on disk between runs.
+#
+# Each file is a fixed header followed by the raw array contents, and is
+# opened with mmap, so a later run maps the pages in rather than rebuilding
+# or parsing anything. The header records the table name, element format,
+# bound, length, a CRC-32 of the payload and the source hash of the module
+# that built it (see _manifest.source_hash), so editing a builder or anything
+# it imports invalidates its tables. A file that does not match is removed.
+# The directory is kept under a size bound, least recently used first.
+
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+
+_DIR = Path(__file__).resolve().parent.parent / ".cache" / "tables"
+_MAGIC = b"EULERTBL"
+_VERSION = 2
+_HEADER = struct.Struct("<8sH16scxxxxxQQI4x16s")  # 72 bytes, so the payload is 8-aligned
+_MIN_BYTES = 1 << 16  # smaller tables are cheaper to rebuild
+_MAX_BYTES = 64 << 20
+
+
+def _files(name):
+    for path in _DIR.glob(f"{name}-*.v{_VERSION}.bin"):
+        try:
+            yield int(path.name.split("-")[1].split(".")[0]), path
+        except ValueError:
+            pass
+
+
+def _open(path, name, source):
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return None
+    if len(mm) < _HEADER.size:
+        return None
+    magic, version, stored, fmt, bound, length, crc, built = _HEADER.unpack_from(mm)
+    fmt = fmt.decode()
+    if (magic, version, stored.rstrip(b"\0")) != (_MAGIC, _VERSION, name.encode()):
+        return None
+    if built != _digest(source):
+        return None
+    try:
+        size = length * struct.calcsize(fmt)
+    except struct.error:
+        return None
+    payload = memoryview(mm)[_HEADER.size:]
+    if len(payload) != size or zlib.crc32(payload) != crc:
+        return None
+    return bound, payload.cast(fmt)
+
+
+def _digest(source):
+    return bytes.fromhex(source)[:16]
+
+
+def load(name, n, source):
+    # The smallest stored table covering [0, n) built by code hashing to
+    # source, as (bound, view), or None.
+    for bound, path in sorted(_files(name)):
+        if bound < n:
+            continue
+        try:
+            found = _open(path, name, source)
+        except OSError:
+            continue
+        if found is None:
+            path.unlink(missing_ok=True)
+            continue
+        os.utime(path)
+        return found
+    return None
+
+
+def save(name, n, buf, source):
+    view = memoryview(buf)
+    if view.nbytes < _MIN_BYTES or view.nbytes > _MAX_BYTES:
+        return
+    header = _HEADER.pack(_MAGIC, _VERSION, name.encode(), view.format.encode(), n,
+                          len(view), zlib.crc32(view.cast("B")), _digest(source))
+    try:
+        _DIR.mkdir(parents=True, exist_ok=True)
+        path = _DIR / f"{name}-{n}.v{_VERSION}.bin"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(view.cast("B"))
+        tmp.replace(path)
+        # Smaller copies of the same table are now redundant.
+        for bound, other in _files(name):
+            if bound < n:
+                other.unlink(missing_ok=True)
+    except OSError:
+        return
+    evict()
+
+
+def evict(max_bytes=_MAX_BYTES):
+    try:
+        entries = [(p.stat(), p) for p in _DIR.glob("*.bin")]
+    except OSError:
+        return
+    entries.sort(key=lambda e: e[0].st_mtime, reverse=True)
+    total = 0
+    for st, path in entries:
+        total += st.st_size
+        if total > max_bytes:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,156 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+# Arithmetic-function tables over [0, n), one builder per function.
+#
+# Each builder walks the primes below n and rewrites the slice of multiples
+# of p (or of p^k) in one list comprehension, so the per-element work runs
+# in C-level slice code rather than a Python loop, and asking for one table
+# never pays for the others. The multiplicative ones (sigma, tau) start from
+# 1 and, at each prime power p^k, swap the factor for p^(k-1) for the one for
+# p^k; the old factor always divides the running product exactly.
+#
+# factorize(n) is for single numbers too large to tabulate: trial division by
+# the primes below 1000, then Miller-Rabin to recognise a prime cofactor and
+# Pollard-Brent rho to split a composite one.
+
+from array import array
+from functools import lru_cache
+from itertools import count
+from math import gcd, isqrt
+
+from .primes import is_prime, primes_below
+
+# bytes.translate table adding one to every byte (omega never reaches 255).
+_INCREMENT = bytes(range(1, 256)) + b"\xff"
+
+
+def spf_table(n):
+    # Smallest prime factor; 0 for 0 and 1.
+    spf = array("I", range(n))
+    # Largest primes first, so smaller ones overwrite their shared multiples.
+    for p in reversed(primes_below(isqrt(max(n - 1, 0)) + 1)):
+        spf[p * p::p] = array("I", [p]) * len(range(p * p, n, p))
+    if n > 1:
+        spf[1] = 0
+    return spf
+
+
+def phi_table(n):
+    # Euler's totient.
+    phi = list(range(n))
+    for p in primes_below(n):
+        phi[p::p] = [x - x // p for x in phi[p::p]]
+    return array("I", phi)
+
+
+def sigma_table(n):
+    # Sum of divisors.
+    sigma = [1] * n
+    for p in primes_below(n):
+        pk, prev, cur = p, 1, 1 + p
+        while pk < n:
+            sigma[pk::pk] = [x // prev * cur for x in sigma[pk::pk]]
+            pk *= p
+            prev, cur = cur, cur + pk
+    if n:
+        sigma[0] = 0
+    return array("Q", sigma)
+
+
+def omega_table(n):
+    # Number of distinct prime factors.
+    omega = bytearray(n)
+    for p in primes_below(n):
+        omega[p::p] = omega[p::p].translate(_INCREMENT)
+    return array("B", omega)
+
+
+def tau_table(n):
+    # Number of divisors.
+    tau = [1] * n
+    for p in primes_below(n):
+        pk, k = p, 1
+        while pk < n:
+            tau[pk::pk] = [x // k * (k + 1) for x in tau[pk::pk]]
+            pk *= p
+            k += 1
+    if n:
+        tau[0] = 0
+    return array("H", tau)
+
+
+def sopf_table(n, lo=0):
+    # Sum of distinct prime factors, for lo..n-1 only if lo is given, so a
+    # table can be extended without redoing the part already built.
+    sopf = [0] * max(n - lo, 0)
+    for p in primes_below(n):
+        first = max(p, -(-lo // p) * p) - lo
+        sopf[first::p] = [x + p for x in sopf[first::p]]
+    return array("I", sopf)
+
+
+TABLES = {
+    "spf": spf_table,
+    "phi": phi_table,
+    "sigma": sigma_table,
+    "omega": omega_table,
+    "tau": tau_table,
+    "sopf": sopf_table,
+}
+
+
+_TRIAL = tuple(primes_below(1000))
+
+
+def _brent(n):
+    # A proper factor of the odd composite n.
+    for c in count(1):
+        y, r, q, g = 2, 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(128, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += 128
+            r *= 2
+        if g == n:
+            # The batch overshot; step back through it one gcd at a time.
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+@lru_cache(maxsize=1 << 16)
+def factorize(n):
+    # The prime factorisation of n >= 1 as sorted (prime, exponent) pairs.
+    if n < 1:
+        raise ValueError(f"cannot factorize {n}")
+    factors = {}
+    for p in _TRIAL:
+        if p * p > n:
+            break
+        if n % p == 0:
+            e = 0
+            while n % p == 0:
+                n //= p
+                e += 1
+            factors[p] = e
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+        else:
+            d = _brent(m)
+            stack += [d, m // d]
+    return tuple(sorted(factors.items()))
@@ -0,0 +1,97 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+# Continued fractions and Pell equations.
+#
+# sqrt_cf(D) expands sqrt(D) as [a0; (a1, ..., ar)] with the usual integer
+# recurrence. The period ends on the first ai equal to 2 * a0. The
+# fundamental solution of x^2 - D y^2 = 1 is the convergent just before the
+# end of the period, or of the second period when r is odd; the first
+# period then gives x^2 - D y^2 = -1. Both are remembered per D, so sweeps
+# that revisit the same discriminants, and neighbouring problems in one
+# process, pay for each expansion once.
+#
+# Every solution of x^2 - D y^2 = N is a base solution times a power of the
+# fundamental unit u = x1 + y1 sqrt(D). pell_power() raises u by repeated
+# squaring of its 2x2 matrix [[x1, D y1], [y1, x1]], and pell_chain() walks
+# base * u^k one step at a time.
+
+from functools import lru_cache
+from itertools import chain, cycle
+from math import isqrt
+
+_MEMO = 1 << 12
+
+
+@lru_cache(maxsize=_MEMO)
+def sqrt_cf(D):
+    # (a0, period); the period is empty when D is a perfect square.
+    a0 = isqrt(D)
+    if a0 * a0 == D:
+        return a0, ()
+    period = []
+    m, d, a = 0, 1, a0
+    while a != 2 * a0:
+        m = d * a - m
+        d = (D - m * m) // d
+        a = (a0 + m) // d
+        period.append(a)
+    return a0, tuple(period)
+
+
+def periodic(D):
+    # The partial quotients of sqrt(D), without end unless D is a square.
+    a0, period = sqrt_cf(D)
+    return chain((a0,), cycle(period)) if period else iter((a0,))
+
+
+def convergents(quotients):
+    # The convergents p/q of [a0; a1, a2, ...] as (p, q) pairs.
+    p0, q0, p1, q1 = 1, 0, 0, 1
+    for a in quotients:
+        p0, p1 = a * p0 + p1, p0
+        q0, q1 = a * q0 + q1, q0
+        yield p0, q0
+
+
+@lru_cache(maxsize=_MEMO)
+def pell(D, sign=1):
+    # The least positive (x, y) with x^2 - D y^2 = sign, sign being 1 or -1;
+    # None if there is no such solution.
+    a0, period = sqrt_cf(D)
+    if not period or (sign < 0 and len(period) % 2 == 0):
+        return None
+    r = len(period)
+    if sign > 0 and r % 2:
+        r *= 2
+    for k, pq in enumerate(convergents(periodic(D))):
+        if k == r - 1:
+            return pq
+
+
+def _times(D, a, b):
+    # (a0 + a1 sqrt(D)) * (b0 + b1 sqrt(D))
+    return a[0] * b[0] + D * a[1] * b[1], a[0] * b[1] + a[1] * b[0]
+
+
+def pell_power(D, k, base=(1, 0)):
+    # base * u^k for the fundamental unit u of x^2 - D y^2 = 1, k >= 0.
+    result, square = base, pell(D)
+    while k:
+        if k & 1:
+            result = _times(D, result, square)
+        square = _times(D, square, square)
+        k >>= 1
+    return result
+
+
+def pell_chain(D, base=None):
+    # base * u, base * u^2, ... for the fundamental unit u; base defaults to u
+    # itself, giving every positive solution of x^2 - D y^2 = 1 in order.
+    unit = pell(D)
+    x = base or unit
+    if base is None:
+        yield x
+    while True:
+        x = _times(D, x, unit)
+        yield x
@@ -0,0 +1,128 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+# Digit arithmetic without going through str().
+#
+# Each function adds up a per-digit value over the decimal digits of n. It
+# peels n apart four digits at a time with divmod and looks each chunk up in
+# a precomputed table of 10^4 entries. Inner chunks use a table that counts
+# their leading zeros; the topmost chunk uses one that does not, so the
+# result is the same as iterating over str(n).
+#
+# signature(n) gives each digit a 16-bit counter. Two numbers have the same
+# signature exactly when they are anagrams of each other, as long as no
+# digit occurs 65536 times or more.
+#
+# Past a few hundred bits, the chunk loop's repeated division gets slow.
+# Large n is converted to decimal once instead, and the occurrences of each
+# digit are counted in the resulting string. decimal_digits(n) does that
+# conversion by divide and conquer: n is split at a power-of-two bit
+# boundary and the halves are recombined in decimal arithmetic, whose
+# multiplication is subquadratic. That makes numbers with millions of digits
+# practical, where str() is quadratic and refuses them past
+# sys.get_int_max_str_digits().
+
+import decimal
+from functools import cache
+from math import factorial
+
+CHUNK = 10 ** 4
+_SHIFT = 16
+_COUNT_BITS = 384  # above this, count digits in decimal_digits(n)
+_SPLIT_BITS = 4096  # below this, Decimal(n) converts directly
+
+_EXACT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN,
+                         traps=[decimal.Inexact])
+
+
+@cache
+def _power_of_two(k):
+    return _EXACT.power(decimal.Decimal(2), k)
+
+
+def _to_decimal(n):
+    if n.bit_length() <= _SPLIT_BITS:
+        return decimal.Decimal(n)
+    k = 1 << (n.bit_length() - 1).bit_length() - 1
+    high = _EXACT.multiply(_to_decimal(n >> k), _power_of_two(k))
+    return _EXACT.add(high, _to_decimal(n & ((1 << k) - 1)))
+
+
+def decimal_digits(n):
+    # The decimal digits of abs(n), as a string.
+    return str(_to_decimal(abs(n)))
+
+
+@cache
+def _values(kind):
+    if kind == "factorial":
+        return [factorial(d) for d in range(10)]
+    if kind == "signature":
+        return [1 << (_SHIFT * d) for d in range(10)]
+    return [d ** kind for d in range(10)]
+
+
+@cache
+def _tables(kind):
+    values = _values(kind)
+    top = [0] * CHUNK
+    for i in range(1, CHUNK):
+        top[i] = top[i // 10] + values[i % 10]
+    pad = [top[i] + (4 - len(str(i))) * values[0] for i in range(CHUNK)]
+    pad[0] = 4 * values[0]
+    top[0] = values[0]
+    return top, pad
+
+
+def _digitwise(kind):
+    top = pad = None
+
+    def total(n):
+        nonlocal top, pad
+        if top is None:
+            top, pad = _tables(kind)
+        if n < 0:
+            n = -n
+        if n < CHUNK:
+            return top[n]
+        if n.bit_length() > _COUNT_BITS:
+            digits = decimal_digits(n)
+            return sum(v * digits.count(d) for d, v in zip("0123456789", _values(kind)) if v)
+        s = 0
+        while n >= CHUNK:
+            n, r = divmod(n, CHUNK)
+            s += pad[r]
+        return s + top[n]
+
+    return total
+
+
+digit_sum = _digitwise(1)
+digit_factorial_sum = _digitwise("factorial")
+signature = _digitwise("signature")
+_power_sums = cache(_digitwise)
+
+
+def digit_power_sum(n, k):
+    return _power_sums(k)(n)
+
+
+if __name__ == "__main__":
+    from timeit import timeit
+
+    facts = [factorial(d) for d in range(10)]
+    cases = [
+        ("digit_sum", lambda n: sum(map(int, str(n))), digit_sum),
+        ("digit_power_sum k=5", lambda n: sum(int(d) ** 5 for d in str(n)),
+         lambda n: digit_power_sum(n, 5)),
+        ("digit_factorial_sum", lambda n: sum(facts[int(d)] for d in str(n)),
+         digit_factorial_sum),
+        ("signature", lambda n: "".join(sorted(str(n))), signature),
+    ]
+    numbers = range(10 ** 5, 10 ** 5 + 20000, 7)
+    for name, slow, fast in cases:
+        fast(0)  # build the tables outside the timing
+        old = timeit(lambda: [slow(n) for n in numbers], number=5)
+        new = timeit(lambda: [fast(n) for n in numbers], number=5)
+        print(f"{name:<20} str {old * 1e3:8.2f}ms  chunks {new * 1e3:8.2f}ms  "
+              f"{old / new:5.1f}x")
@@ -0,0 +1,96 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+# Integer partition counts.
+#
+# Unrestricted counts come from Euler's pentagonal number theorem:
+#
+#     p(n) = sum over k >= 1 of (-1)^(k+1) (p(n - k(3k-1)/2) + p(n - k(3k+1)/2))
+#
+# The generalised pentagonal offsets are tabulated once, split by sign. Each
+# p(n) is then two sums over the offsets up to n, gathered with map() rather
+# than a Python-level loop. Counting in modular mode keeps every term small.
+#
+# Partitions restricted to a set of parts (primes, parts below k, coins)
+# multiply in one factor 1 / (1 - x^part) per part, an O(n) pass each.
+# Partitions into primes can also be streamed without a bound fixed in
+# advance. Taking the logarithmic derivative of the product over primes
+# gives
+#
+#     n k(n) = sum over 1 <= j <= n of sopf(j) k(n - j)
+#
+# where sopf(j) is the sum of the distinct primes dividing j.
+
+import threading
+from array import array
+from itertools import count, islice
+from operator import mul
+
+from .arith import sopf_table
+
+_plus = []  # k(3k -+ 1)/2 for odd k, which enter with a plus sign
+_minus = []  # the same for even k
+_lock = threading.Lock()
+
+
+def _extend(n):
+    # Make both tables reach past n. Problems on a thread pool share them, so
+    # k is derived from their lengths and both are grown under the lock;
+    # readers only ever look at entries already there.
+    with _lock:
+        k = (len(_plus) + len(_minus)) // 2
+        while not _minus or _minus[-1] <= n:
+            k += 1
+            offsets = _plus if k & 1 else _minus
+            offsets += [k * (3 * k - 1) // 2, k * (3 * k + 1) // 2]
+
+
+def partition_numbers(mod=None):
+    # p(0), p(1), p(2), ... without end, exact or reduced mod `mod`.
+    p = [1]
+    yield 1
+    plus = minus = 0  # how many offsets of each sign are <= n
+    for n in count(1):
+        if not _minus or _minus[-1] <= n:
+            _extend(2 * n)
+        while plus < len(_plus) and _plus[plus] <= n:
+            plus += 1
+        while minus < len(_minus) and _minus[minus] <= n:
+            minus += 1
+        total = (sum(map(p.__getitem__, map(n.__sub__, islice(_plus, plus))))
+                 - sum(map(p.__getitem__, map(n.__sub__, islice(_minus, minus)))))
+        if mod is not None:
+            total %= mod
+        p.append(total)
+        yield total
+
+
+def partition(n, mod=None):
+    return next(islice(partition_numbers(mod), n, None))
+
+
+def restricted_partitions(parts, n, mod=None):
+    # Counts for 0..n of the partitions using only the given distinct parts.
+    ways = [1] + [0] * n
+    for part in parts:
+        if part > n:
+            continue
+        if mod is None:
+            for j in range(part, n + 1):
+                ways[j] += ways[j - part]
+        else:
+            for j in range(part, n + 1):
+                ways[j] = (ways[j] + ways[j - part]) % mod
+    return ways
+
+
+def prime_partition_numbers():
+    # k(0), k(1), k(2), ...: the number of ways to write n as a sum of primes.
+    kappa = [1]
+    yield 1
+    sopf = array("I")
+    for n in count(1):
+        if n >= len(sopf):
+            sopf += sopf_table(max(64, 2 * n), len(sopf))
+        kappa.append(sum(map(mul, islice(sopf, 1, n + 1), reversed(kappa))) // n)
+        yield kappa[-1]
@@ -0,0 +1,201 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+# Prime sieves.
+#
+# Only odd numbers are sieved. The sieve walks the range in fixed-size
+# segments, so memory stays bounded by one segment plus the base primes up to
+# sqrt(hi) however far it goes. bitmap() keeps one bit per odd number: bit i
+# of the packed bytes stands for 2i + 1.
+#
+# is_prime(n) answers single queries: a bitmap lookup below CUTOFF, otherwise
+# Miller-Rabin with a fixed set of bases, which is exact for every n below
+# 3.3e24 and so for all 64-bit inputs. Past that it is a strong probable-prime
+# test.
+#
+# prime_count(n) and prime_sum(n) give pi(n) and the sum of the primes up to
+# n without sieving that far, by Lucy_Hedgehog's method in O(n^(3/4)) time
+# and O(sqrt(n)) space.
+
+from array import array
+from itertools import compress
+from math import isqrt
+
+SEGMENT = 1 << 18  # odd numbers per segment
+CUTOFF = 1 << 16
+
+# (bound, bases): the bases prove primality for every n below the bound.
+_WITNESSES = (
+    (3_215_031_751, (2, 3, 5, 7)),
+    (3_474_749_660_383, (2, 3, 5, 7, 11, 13)),
+    (341_550_071_728_321, (2, 3, 5, 7, 11, 13, 17)),
+    (3_825_123_056_546_413_051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (None, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+)
+
+_BITS = bytes.maketrans(b"\x00\x01", b"01")
+_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _odd_primes(n):
+    # Odd primes up to and including n, by a plain odds-only sieve.
+    m = (n + 1) // 2  # flags[i] stands for 2i + 1
+    if m < 2:
+        return []
+    flags = bytearray(b"\x01") * m
+    flags[0] = 0
+    for i in range(1, (isqrt(n) + 1) // 2):
+        if flags[i]:
+            p = 2 * i + 1
+            flags[p * p // 2::p] = bytes(len(range(p * p // 2, m, p)))
+    return list(compress(range(1, 2 * m, 2), flags))
+
+
+def _odd_segments(lo, hi, size=SEGMENT):
+    # Yields (start, flags) covering the odd numbers in [lo, hi): start is odd
+    # and flags[i] is 1 iff start + 2i is prime.
+    start = lo | 1
+    base = _odd_primes(isqrt(max(hi - 1, 0)))
+    while start < hi:
+        m = min(size, (hi - start + 1) // 2)
+        end = start + 2 * m
+        flags = bytearray(b"\x01") * m
+        for p in base:
+            if p * p >= end:
+                break
+            first = max(p * p, (start + p - 1) // p * p)
+            if not first & 1:
+                first += p
+            i = (first - start) // 2
+            flags[i::p] = bytes(len(range(i, m, p)))
+        if start == 1:
+            flags[0] = 0
+        yield start, flags
+        start = end
+
+
+def segments(lo, hi, size=SEGMENT):
+    # The primes in [lo, hi), one array per segment of the range.
+    lo = max(lo, 0)
+    if lo <= 2 < hi:
+        yield array("Q", [2])
+    for start, flags in _odd_segments(lo, hi, size):
+        yield array("Q", compress(range(start, start + 2 * len(flags), 2), flags))
+
+
+def primes_below(n):
+    primes = array("I", [2] if n > 2 else [])
+    for start, flags in _odd_segments(3, n):
+        primes.extend(compress(range(start, start + 2 * len(flags), 2), flags))
+    return primes
+
+
+def bitmap(n):
+    # Packed is-prime bits for the odd numbers below n, least significant
+    # bit first.
+    bits = bytearray()
+    for start, flags in _odd_segments(1, n):
+        if len(flags) & 7:
+            flags += bytes(8 - (len(flags) & 7))
+        bits += int(flags.translate(_BITS)[::-1], 2).to_bytes(len(flags) // 8, "little")
+    return bits
+
+
+class Bitmap:
+    # Read-only is_prime[k] over packed bits as made by bitmap(). Each lookup
+    # is a Python-level call; hot loops should index flat() instead.
+
+    __slots__ = ("bits", "n")
+
+    def __init__(self, bits, n):
+        self.bits = bits
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, k):
+        if k & 1 and 0 < k < self.n:
+            return self.bits[k >> 4] >> (k >> 1 & 7) & 1
+        if not 0 <= k < self.n:
+            raise IndexError("is_prime index out of range")
+        return int(k == 2)
+
+    def flat(self):
+        # One byte per number below n, 1 for the primes: an eighth of the
+        # density but plain bytes indexing.
+        n = self.n
+        odd = len(range(1, n, 2))
+        size = (odd + 7) // 8
+        digits = format(int.from_bytes(self.bits[:size], "little"), f"0{8 * size}b")
+        flags = bytearray(n)
+        flags[1::2] = digits[::-1][:odd].encode().translate(_FLAGS)
+        if n > 2:
+            flags[2] = 1
+        return bytes(flags)
+
+
+_small = bitmap(CUTOFF)
+
+
+def is_prime(n):
+    if n < CUTOFF:
+        if n & 1:
+            return n > 0 and bool(_small[n >> 4] >> (n >> 1 & 7) & 1)
+        return n == 2
+    if not n & 1 or n % 3 == 0 or n % 5 == 0 or n % 7 == 0:
+        return False
+    d, s = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    for bound, bases in _WITNESSES:
+        if bound is None or n < bound:
+            break
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _lucy(n, weight):
+    # S(v) = sum of weight(p) over primes p <= v, for every v of the form
+    # n // i. small[v] holds S(v) for v <= r and large[i] holds S(n // i).
+    # Starting from all integers in [2, v], each prime p <= r takes out the
+    # numbers whose smallest prime factor is p.
+    if n < 2:
+        return 0
+    r = isqrt(n)
+    if weight:
+        total = lambda v: v * (v + 1) // 2 - 1
+    else:
+        total = lambda v: v - 1
+    small = [0] + [total(v) for v in range(1, r + 1)]
+    large = [0] + [total(n // i) for i in range(1, r + 1)]
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue
+        below = small[p - 1]
+        w = p if weight else 1
+        pp = p * p
+        for i in range(1, min(r, n // pp) + 1):
+            ip = i * p
+            large[i] -= w * ((large[ip] if ip <= r else small[n // ip]) - below)
+        for v in range(r, pp - 1, -1):
+            small[v] -= w * (small[v // p] - below)
+    return large[1]
+
+
+def prime_count(n):
+    return _lucy(n, False)
+
+
+def prime_sum(n):
+    return _lucy(n, True)
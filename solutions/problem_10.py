@@ -1,14 +1,15 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
-    limit = 2_000_000
-    sieve = [True] * limit
-    sieve[0] = sieve[1] = False
-    for i in range(2, int(limit ** 0.5) + 1):
-        if sieve[i]:
-            sieve[i*i::i] = [False] * len(sieve[i*i::i])
-    return sum(i for i, v in enumerate(sieve) if v)
+from .primes import prime_sum
+from .tables import table
+
+REQUIRES = {"primes": 2_000_000}
+
+def solve(limit=REQUIRES["primes"]):
+    if limit <= REQUIRES["primes"]:
+        return sum(table("primes", limit))
+    return prime_sum(limit - 1)
 
 if __name__ == "__main__":
     print(solve())
@@ -1,13 +1,14 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
-    x, y = 1, 1
-    while True:
-        x, y = 3*x + 4*y, 2*x + 3*y
+from .cf import pell, pell_chain
+
+def solve(limit=10**12):
+    # x^2 - 2y^2 = -1 with x = 2n - 1 and y = 2b - 1.
+    for x, y in pell_chain(2, pell(2, -1)):
         n = (x + 1) // 2
         b = (y + 1) // 2
-        if n > 10**12:
+        if n > limit:
             return b
 
 if __name__ == "__main__":
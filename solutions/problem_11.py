@@ -2,10 +2,10 @@
 # SPDX-License-Identifier: MIT
 
 from math import prod
-from . import data
+from . import data_grid
 
 def solve():
-    grid = [[int(x) for x in line.split()] for line in data(11).splitlines()]
+    grid = data_grid(11)
 
     best = 0
     for r in range(20):
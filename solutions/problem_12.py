@@ -1,19 +1,13 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
+from math import prod
+
+from .arith import factorize
+
+def solve(threshold=500):
     def ndivisors(n):
-        count, d = 1, 2
-        while d * d <= n:
-            exp = 0
-            while n % d == 0:
-                n //= d
-                exp += 1
-            count *= exp + 1
-            d += 1
-        if n > 1:
-            count *= 2
-        return count
+        return prod(e + 1 for _, e in factorize(n))
 
     n = 1
     dn = ndivisors(1)
@@ -24,7 +18,7 @@ def solve():
             total = ndivisors(n // 2) * dn1
         else:
             total = dn * ndivisors((n + 1) // 2)
-        if total > 500:
+        if total > threshold:
             return n * (n + 1) // 2
         dn = dn1
 
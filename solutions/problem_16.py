@@ -1,8 +1,10 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
-    return sum(int(d) for d in str(2 ** 1000))
+from .digits import digit_sum
+
+def solve(exponent=1000):
+    return digit_sum(2 ** exponent)
 
 if __name__ == "__main__":
     print(solve())
@@ -1,24 +1,18 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from . import data
+from . import data_triangle
 
-def _parse_triangle(text):
-    return [[int(x) for x in line.split()] for line in text.strip().splitlines()]
-
-def _reform(triangle):
-    lrow = triangle[-1]
-    triangle.append([max(lrow[i], lrow[i + 1]) + v for i, v in enumerate(triangle[-2])])
-    del triangle[-3:-1]
-
-def max_path_sum(triangle):
-    while len(triangle) != 1:
-        _reform(triangle)
-    return triangle[0][0]
+def max_path_sum(rows):
+    # Top-down, so rows can be consumed as they are read.
+    best = []
+    for row in rows:
+        best = [v + max(best[i - 1] if i else 0, best[i] if i < len(best) else 0)
+                for i, v in enumerate(row)]
+    return max(best)
 
 def solve():
-    triangle = _parse_triangle(data(18))
-    return max_path_sum(triangle)
+    return max_path_sum(data_triangle(18))
 
 if __name__ == "__main__":
     print(solve())
@@ -3,8 +3,10 @@
 
 from math import factorial
 
-def solve():
-    return sum(int(d) for d in str(factorial(100)))
+from .digits import digit_sum
+
+def solve(n=100):
+    return digit_sum(factorial(n))
 
 if __name__ == "__main__":
     print(solve())
@@ -1,12 +1,14 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .tables import table
+
+REQUIRES = {"sigma": 10000}
+
 def solve():
-    limit = 10000
-    d = [0] * limit
-    for i in range(1, limit):
-        for j in range(2 * i, limit, i):
-            d[j] += i
+    limit = REQUIRES["sigma"]
+    sigma = table("sigma", limit)
+    d = [s - i for i, s in enumerate(sigma)]
     return sum(a for a in range(2, limit) if d[a] < limit and d[a] != a and d[d[a]] == a)
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from . import data
+from . import data_words
 
 def solve():
-    names = sorted(data(22).replace('"', '').split(','))
+    names = sorted(data_words(22))
     return sum(
         (i + 1) * sum(ord(c) - 64 for c in name)
         for i, name in enumerate(names)
@@ -1,13 +1,14 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .tables import table
+
+REQUIRES = {"sigma": 28124}
+
 def solve():
     limit = 28123
-    d = [0] * (limit + 1)
-    for i in range(1, limit + 1):
-        for j in range(2 * i, limit + 1, i):
-            d[j] += i
-    abundants = [i for i in range(12, limit + 1) if d[i] > i]
+    sigma = table("sigma", REQUIRES["sigma"])
+    abundants = [i for i in range(12, limit + 1) if sigma[i] > 2 * i]
     expressible = bytearray(limit + 1)
     for i, a in enumerate(abundants):
         for b in abundants[i:]:
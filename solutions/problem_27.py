@@ -1,17 +1,13 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
-    def sieve(n):
-        s = bytearray(b'\x01') * n
-        s[0] = s[1] = 0
-        for i in range(2, int(n**0.5) + 1):
-            if s[i]:
-                s[i*i::i] = bytearray(len(s[i*i::i]))
-        return s
+from .tables import table
+
+REQUIRES = {"sieve": 100000, "primes": 1000}
 
-    is_prime = sieve(100000)
-    primes_under_1000 = [p for p in range(2, 1000) if is_prime[p]]
+def solve():
+    is_prime = table("sieve", REQUIRES["sieve"]).flat()
+    primes_under_1000 = table("primes", 1000)
 
     best, result = 0, 0
     for b in primes_under_1000:
@@ -1,14 +1,10 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
-    n = 600851475143
-    d = 2
-    while d * d <= n:
-        while n % d == 0:
-            n //= d
-        d += 1
-    return n
+from .arith import factorize
+
+def solve(n=600851475143):
+    return factorize(n)[-1][0]
 
 if __name__ == "__main__":
     print(solve())
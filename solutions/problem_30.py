@@ -1,10 +1,12 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .digits import digit_power_sum
+
 def solve():
     total = 0
     for n in range(2, 999999):
-        if n == sum(int(d) ** 5 for d in str(n)):
+        if n == digit_power_sum(n, 5):
             total += n
     return total
 
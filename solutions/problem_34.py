@@ -1,11 +1,10 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from math import factorial
+from .digits import digit_factorial_sum
 
 def solve():
-    facts = [factorial(i) for i in range(10)]
-    return sum(n for n in range(3, 100000) if n == sum(facts[int(d)] for d in str(n)))
+    return sum(n for n in range(3, 100000) if n == digit_factorial_sum(n))
 
 if __name__ == "__main__":
     print(solve())
@@ -1,19 +1,16 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .tables import table
+
+REQUIRES = {"sieve": 1000000, "primes": 1000000}
+
 def solve():
-    limit = 1000000
-    sieve = [True] * limit
-    sieve[0] = sieve[1] = False
-    for i in range(2, int(limit ** 0.5) + 1):
-        if sieve[i]:
-            for j in range(i * i, limit, i):
-                sieve[j] = False
+    limit = REQUIRES["sieve"]
+    sieve = table("sieve", limit).flat()
 
     count = 0
-    for n in range(2, limit):
-        if not sieve[n]:
-            continue
+    for n in table("primes", limit):
         s = str(n)
         rotations = [int(s[i:] + s[:i]) for i in range(len(s))]
         if all(r < limit and sieve[r] for r in rotations):
@@ -3,21 +3,9 @@
 
 from itertools import permutations
 
-def solve():
-    def is_prime(n):
-        if n < 2:
-            return False
-        if n < 4:
-            return True
-        if n % 2 == 0 or n % 3 == 0:
-            return False
-        i = 5
-        while i * i <= n:
-            if n % i == 0 or n % (i + 2) == 0:
-                return False
-            i += 6
-        return True
+from .primes import is_prime
 
+def solve():
     for n in range(7, 0, -1):
         digits = list(range(n, 0, -1))
         for perm in permutations(digits):
@@ -1,10 +1,10 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from . import data
+from . import data_words
 
 def solve():
-    words = [w.strip('"') for w in data(42).split(",")]
+    words = data_words(42)
     triangles = set(n * (n + 1) // 2 for n in range(1, 100))
     count = 0
     for word in words:
@@ -1,17 +1,18 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .tables import table
+
+REQUIRES = {"omega": 200000}
+
 def solve():
-    limit = 200000
-    factor_count = [0] * limit
+    limit = REQUIRES["omega"]
+    omega = table("omega", limit)
+    run = 0
     for i in range(2, limit):
-        if factor_count[i] == 0:
-            for j in range(i, limit, i):
-                factor_count[j] += 1
-    for i in range(2, limit - 3):
-        if (factor_count[i] == 4 and factor_count[i + 1] == 4 and
-                factor_count[i + 2] == 4 and factor_count[i + 3] == 4):
-            return i
+        run = run + 1 if omega[i] == 4 else 0
+        if run == 4:
+            return i - 3
 
 if __name__ == "__main__":
     print(solve())
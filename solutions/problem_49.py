@@ -1,18 +1,17 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .tables import table
+
+REQUIRES = {"sieve": 10000, "primes": 10000}
+
 def solve():
-    sieve = [True] * 10000
-    sieve[0] = sieve[1] = False
-    for i in range(2, 100):
-        if sieve[i]:
-            for j in range(i * i, 10000, i):
-                sieve[j] = False
+    sieve = table("sieve", REQUIRES["sieve"]).flat()
 
-    for a in range(1000, 10000):
-        if not sieve[a] or a == 1487:
+    for a in table("primes", REQUIRES["primes"]):
+        if a < 1000 or a == 1487:
             continue
-        for d in range(1, (10000 - a) // 2 + 1):
+        for d in range(2, (10000 - a) // 2 + 1, 2):  # b and c stay odd
             b = a + d
             c = a + 2 * d
             if c >= 10000:
@@ -1,14 +1,13 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .tables import table
+
+REQUIRES = {"primes": 1_000_000}
+
 def solve():
-    limit = 1_000_000
-    sieve = bytearray(b'\x01') * limit
-    sieve[0] = sieve[1] = 0
-    for i in range(2, int(limit**0.5) + 1):
-        if sieve[i]:
-            sieve[i*i::i] = bytearray(len(sieve[i*i::i]))
-    primes = [i for i in range(2, limit) if sieve[i]]
+    limit = REQUIRES["primes"]
+    primes = table("primes", limit)
     prime_set = set(primes)
     prefix = [0]
     for p in primes:
@@ -3,18 +3,15 @@
 
 from itertools import combinations
 
+from .tables import table
+
+REQUIRES = {"sieve": 1000000, "primes": 1000000}
+
 def solve():
-    limit = 1000000
-    sieve = [True] * limit
-    sieve[0] = sieve[1] = False
-    for i in range(2, int(limit ** 0.5) + 1):
-        if sieve[i]:
-            for j in range(i * i, limit, i):
-                sieve[j] = False
+    limit = REQUIRES["sieve"]
+    sieve = table("sieve", limit).flat()
 
-    for n in range(10, limit):
-        if not sieve[n]:
-            continue
+    for n in table("primes", limit)[4:]:
         s = str(n)
         digits = len(s)
         for size in range(1, digits):
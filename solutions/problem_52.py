@@ -1,10 +1,12 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .digits import signature
+
 def solve():
     n = 1
     while True:
-        if all(sorted(str(n)) == sorted(str(n * k)) for k in range(2, 7)):
+        if all(signature(n) == signature(n * k) for k in range(2, 7)):
             return n
         n += 1
 
@@ -1,7 +1,7 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from . import data
+from . import data_lines
 
 def card_value(card):
     values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8,
@@ -42,11 +42,9 @@ def hand_rank(hand):
     return (0, ordered)
 
 def solve():
-    lines = data(54).strip().splitlines()
-
     wins = 0
-    for line in lines:
-        cards = line.split()
+    for line in data_lines(54):
+        cards = line.decode().split()
         hand1 = cards[:5]
         hand2 = cards[5:]
         if hand_rank(hand1) > hand_rank(hand2):
@@ -1,11 +1,15 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
+from .digits import digit_sum
+
+def solve(limit=100):
     best = 0
-    for a in range(1, 100):
-        for b in range(1, 100):
-            s = sum(int(d) for d in str(a ** b))
+    for a in range(1, limit):
+        power = 1
+        for b in range(1, limit):
+            power *= a
+            s = digit_sum(power)
             if s > best:
                 best = s
     return best
@@ -1,11 +1,13 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
+from itertools import islice
+
+from .cf import convergents, periodic
+
+def solve(expansions=1000):
     count = 0
-    n, d = 1, 1
-    for _ in range(1000):
-        n, d = n + 2 * d, n + d
+    for n, d in islice(convergents(periodic(2)), 1, expansions + 1):
         if len(str(n)) > len(str(d)):
             count += 1
     return count
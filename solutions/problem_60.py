@@ -1,36 +1,16 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
-    def sieve(limit):
-        s = [True] * limit
-        s[0] = s[1] = False
-        for i in range(2, int(limit ** 0.5) + 1):
-            if s[i]:
-                for j in range(i * i, limit, i):
-                    s[j] = False
-        return s
+from .primes import is_prime
+from .tables import table
 
-    def is_prime(n):
-        if n < 2:
-            return False
-        if n < prime_limit:
-            return prime_sieve[n]
-        if n % 2 == 0 or n % 3 == 0:
-            return False
-        i = 5
-        while i * i <= n:
-            if n % i == 0 or n % (i + 2) == 0:
-                return False
-            i += 6
-        return True
+REQUIRES = {"primes": 100000}
 
+def solve():
     def pair_check(a, b):
         return is_prime(int(str(a) + str(b))) and is_prime(int(str(b) + str(a)))
 
-    prime_limit = 100000
-    prime_sieve = sieve(prime_limit)
-    primes = [i for i in range(2, prime_limit) if prime_sieve[i]]
+    primes = table("primes", REQUIRES["primes"])
 
     pair_cache = {}
     def pairs(a, b):
@@ -3,12 +3,14 @@
 
 from collections import defaultdict
 
+from .digits import signature
+
 def solve():
     cubes = defaultdict(list)
     n = 1
     while True:
         c = n ** 3
-        key = ''.join(sorted(str(c)))
+        key = signature(c)
         cubes[key].append(c)
         if len(cubes[key]) == 5:
             return min(cubes[key])
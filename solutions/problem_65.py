@@ -1,7 +1,10 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
+from .cf import convergents
+from .digits import digit_sum
+
+def solve(terms=100):
     def e_cf(n):
         if n == 0:
             return 2
@@ -9,10 +12,9 @@ def solve():
             return 2 * (n // 3 + 1)
         return 1
 
-    n, d = 1, 0
-    for i in range(99, -1, -1):
-        n, d = d + n * e_cf(i), n
-    return sum(int(c) for c in str(n))
+    for n, _ in convergents(map(e_cf, range(terms))):
+        pass
+    return digit_sum(n)
 
 if __name__ == "__main__":
     print(solve())
@@ -1,12 +1,11 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from .problem_18 import _parse_triangle, max_path_sum
-from . import data
+from .problem_18 import max_path_sum
+from . import data_lines
 
 def solve():
-    triangle = _parse_triangle(data(67))
-    return max_path_sum(triangle)
+    return max_path_sum([int(x) for x in line.split()] for line in data_lines(67))
 
 if __name__ == "__main__":
     print(solve())
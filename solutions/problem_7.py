@@ -3,20 +3,26 @@
 
 from math import log
 
-def solve():
-    n = 10001
-    limit = int(n * (log(n) + log(log(n)))) + 100
-    sieve = bytearray(b'\x01') * limit
-    sieve[0] = sieve[1] = 0
-    for i in range(2, int(limit**0.5) + 1):
-        if sieve[i]:
-            sieve[i*i::i] = bytearray(len(sieve[i*i::i]))
-    count = 0
-    for i in range(2, limit):
-        if sieve[i]:
-            count += 1
-            if count == n:
-                return i
+from .primes import prime_count
+from .tables import table
+
+# The 10001st prime is below n(ln n + ln ln n) for n = 10001.
+REQUIRES = {"primes": 114_320}
+
+def solve(n=10001):
+    primes = table("primes", REQUIRES["primes"])
+    if n <= len(primes):
+        return primes[n - 1]
+    # n(ln n + ln ln n - 1) < p_n < n(ln n + ln ln n) for n >= 6.
+    lo = int(n * (log(n) + log(log(n)) - 1))
+    hi = int(n * (log(n) + log(log(n)))) + 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if prime_count(mid) >= n:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
 
 if __name__ == "__main__":
     print(solve())
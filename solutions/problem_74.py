@@ -1,14 +1,9 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from math import factorial
+from .digits import digit_factorial_sum
 
 def solve():
-    fact = [factorial(d) for d in range(10)]
-
-    def digit_fact_sum(n):
-        return sum(fact[int(d)] for d in str(n))
-
     cache = {}
     def chain_length(n):
         seen = []
@@ -22,7 +17,7 @@ def solve():
                 return cache[n]
             visited.add(current)
             seen.append(current)
-            current = digit_fact_sum(current)
+            current = digit_factorial_sum(current)
         cycle_start = seen.index(current)
         cycle_len = len(seen) - cycle_start
         for i in range(cycle_start, len(seen)):
@@ -1,18 +1,19 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from decimal import Decimal, getcontext
+from math import isqrt
 
-def solve():
-    getcontext().prec = 110
-    perfect = {i*i for i in range(11)}
+from .digits import digit_sum
+
+def solve(limit=100, digits=100):
     total = 0
-    for n in range(1, 101):
-        if n in perfect:
+    for n in range(1, limit + 1):
+        root = isqrt(n)
+        if root * root == n:
             continue
-        root = Decimal(n).sqrt()
-        digits_str = str(root).replace('.', '')[:100]
-        total += sum(int(d) for d in digits_str)
+        # The first `digits` digits of sqrt(n), integer part included.
+        shift = digits - len(str(root))
+        total += digit_sum(isqrt(n * 10 ** (2 * shift)))
     return total
 
 if __name__ == "__main__":
@@ -1,23 +1,22 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from . import data
+from . import data_lines
 
 def solve():
-    matrix = [[int(x) for x in line.strip().split(',')] for line in data(81).splitlines() if line.strip()]
-
-    n = len(matrix)
-    for i in range(n):
-        for j in range(n):
-            if i == 0 and j == 0:
-                continue
-            elif i == 0:
-                matrix[i][j] += matrix[i][j-1]
-            elif j == 0:
-                matrix[i][j] += matrix[i-1][j]
-            else:
-                matrix[i][j] += min(matrix[i-1][j], matrix[i][j-1])
-    return matrix[n-1][n-1]
+    dp = None
+    for line in data_lines(81):
+        row = [int(x) for x in line.split(b',')]
+        if dp is None:
+            dp = [0] * len(row)
+            dp[0] = row[0]
+            for j in range(1, len(row)):
+                dp[j] = dp[j-1] + row[j]
+            continue
+        dp[0] += row[0]
+        for j in range(1, len(row)):
+            dp[j] = min(dp[j], dp[j-1]) + row[j]
+    return dp[-1]
 
 if __name__ == "__main__":
     print(solve())
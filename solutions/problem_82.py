@@ -1,10 +1,10 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from . import data
+from . import data_grid
 
 def solve():
-    matrix = [[int(x) for x in line.strip().split(',')] for line in data(82).splitlines() if line.strip()]
+    matrix = data_grid(82)
 
     n = len(matrix)
     dp = [matrix[i][0] for i in range(n)]
@@ -1,11 +1,11 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from . import data
+from . import data_grid
 import heapq
 
 def solve():
-    matrix = [[int(x) for x in line.strip().split(',')] for line in data(83).splitlines() if line.strip()]
+    matrix = data_grid(83)
 
     n = len(matrix)
     dist = [[float('inf')] * n for _ in range(n)]
@@ -1,18 +1,15 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .tables import table
+
+# Primes up to the square root of the limit, 50000000.
+REQUIRES = {"primes": 7073}
+
 def solve():
     limit = 50000000
 
-    def sieve(n):
-        is_prime = [False, False] + [True] * (n - 1)
-        for i in range(2, int(n**0.5) + 1):
-            if is_prime[i]:
-                for j in range(i*i, n+1, i):
-                    is_prime[j] = False
-        return [i for i in range(2, n+1) if is_prime[i]]
-
-    primes = sieve(int(limit**0.5) + 1)
+    primes = table("primes", REQUIRES["primes"])
 
     squares = [p*p for p in primes if p*p < limit]
     cubes = [p**3 for p in primes if p**3 < limit]
@@ -1,13 +1,15 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .digits import digit_power_sum
+
 def solve():
     max_sq = 567
     to_89 = set()
     for n in range(1, max_sq + 1):
         k = n
         while k != 1 and k != 89:
-            k = sum(int(d) ** 2 for d in str(k))
+            k = digit_power_sum(k, 2)
         if k == 89:
             to_89.add(n)
     ways = [0] * (max_sq + 1)
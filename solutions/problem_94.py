@@ -1,13 +1,13 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-def solve():
-    limit = 10**9
+from .cf import pell_chain
+
+def solve(limit=10**9):
     total = 0
-    x, y = 2, 0
 
-    while True:
-        x, y = 2*x + 3*y, x + 2*y
+    # x^2 - 3y^2 = 4, from the trivial solution (2, 0) times powers of 2 + sqrt(3).
+    for x, y in pell_chain(3, (2, 0)):
         if (x + 1) % 3 == 0:
             a = (x + 1) // 3
             if a > 1:
@@ -1,12 +1,13 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
+from .tables import table
+
+REQUIRES = {"sigma": 1000001}
+
 def solve():
     limit = 1000000
-    spd = [0] * (limit + 1)
-    for i in range(1, limit + 1):
-        for j in range(2 * i, limit + 1, i):
-            spd[j] += i
+    spd = [s - i for i, s in enumerate(table("sigma", REQUIRES["sigma"]))]
 
     best_length = 0
     best_min = 0
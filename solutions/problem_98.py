@@ -1,12 +1,12 @@
 # Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
 # SPDX-License-Identifier: MIT
 
-from . import data
+from . import data_words
 from itertools import permutations
 from math import isqrt
 
 def solve():
-    words = data(98).replace('"', '').split(',')
+    words = data_words(98)
 
     anagram_groups = {}
     for word in words:
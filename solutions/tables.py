@@ -0,0 +1,130 @@
+# Copyright (c) 2022 Achyuth Jayadevan <achyuth@jayadevan.in>
+# SPDX-License-Identifier: MIT
+
+# Precomputed tables shared between problems.
+#
+# table(name, n) returns a read-only view covering [0, n): entries 0..n-1 for
+# the arith tables (spf, phi, sigma, omega, tau, sopf), the primes below n for
+# "primes", and a primes.Bitmap over packed bits for "sieve" (whose flat()
+# gives byte-per-number flags for hot loops). A table is built once per
+# process at the largest size asked for so far, or mapped from a copy an
+# earlier run saved on disk (see _tablecache).
+#
+# Problem modules declare what they use, e.g.
+#
+#     REQUIRES = {"primes": 1_000_000, "sigma": 10_000}
+#
+# and the runner builds each table once at the largest size any selected
+# problem declares. Forked workers inherit it as it is; under spawn or
+# forkserver it is published in shared memory, and workers attach to the
+# published buffer instead of building their own copy.
+
+import sys
+from array import array
+from bisect import bisect_left
+from multiprocessing import shared_memory
+
+from . import _manifest, _tablecache, arith as _arith, primes as _primes
+
+_BUILDERS = {}
+_VIEWS = {}
+_local = {}
+_bounds = {}
+_published = []
+_attached = []
+
+
+def _builder(name, view=None):
+    # view(buffer, n) turns the stored buffer into what table() hands out;
+    # by default the first n entries.
+    def register(func):
+        _BUILDERS[name] = func
+        if view is not None:
+            _VIEWS[name] = view
+        return func
+    return register
+
+
+_builder("sieve", view=_primes.Bitmap)(_primes.bitmap)
+_builder("primes", view=lambda primes, n: primes[:bisect_left(primes, n)])(_primes.primes_below)
+
+
+for _name, _build in _arith.TABLES.items():
+    _builder(_name)(_build)
+
+
+def _source(name):
+    # Stored tables are only trusted while their builder's code is unchanged.
+    return _manifest.source_hash(_BUILDERS[name].__module__.rpartition(".")[2])
+
+
+def table(name, n):
+    if _bounds.get(name, 0) < n:
+        source = _source(name)
+        found = _tablecache.load(name, n, source)
+        if found is None:
+            buf = _BUILDERS[name](n)
+            _tablecache.save(name, n, buf, source)
+            found = n, buf
+        _bounds[name], buf = found
+        _local[name] = memoryview(buf).toreadonly()
+    view = _VIEWS.get(name)
+    return view(_local[name], n) if view else _local[name][:n]
+
+
+def merge(requirements):
+    sizes = {}
+    for requires in requirements:
+        for name, n in requires.items():
+            if name not in _BUILDERS:
+                raise KeyError(f"unknown table {name!r}")
+            sizes[name] = max(sizes.get(name, 0), n)
+    return {name: sizes[name] for name in _BUILDERS if name in sizes}
+
+
+class _Attached(shared_memory.SharedMemory):
+    def __del__(self):
+        pass  # views handed out may outlive us; the mapping goes with the process
+
+
+def _attach(name):
+    if sys.version_info >= (3, 13):
+        return _Attached(name, track=False)
+    # Only the publishing process should own the segment; before 3.13 every
+    # attach registers it with the resource tracker, which would unlink it.
+    from multiprocessing import resource_tracker
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return _Attached(name)
+    finally:
+        resource_tracker.register = register
+
+
+def publish(sizes):
+    handles = {}
+    for name, n in sizes.items():
+        table(name, n)
+        view = _local[name]
+        shm = shared_memory.SharedMemory(create=True, size=max(view.nbytes, 1))
+        shm.buf[:view.nbytes] = view.cast("B")
+        _published.append(shm)
+        handles[name] = (shm.name, n, len(view), view.format)
+    return handles
+
+
+def attach(handles):
+    for name, (shm_name, n, length, fmt) in handles.items():
+        if _bounds.get(name, 0) < n:
+            shm = _attach(shm_name)
+            _attached.append(shm)
+            _local[name] = shm.buf[:length * array(fmt).itemsize].toreadonly().cast(fmt)
+            _bounds[name] = n
+
+
+def release():
+    # Publishing side only, once the workers are done.
+    while _published:
+        shm = _published.pop()
+        shm.close()
+        shm.unlink()